@@ -2,34 +2,49 @@
 Main bot logic for the MAITRIX bot.
 """
 
-import time
+import json
 import logging
-from typing import Dict, Any, List, Tuple
-from decimal import Decimal
+from concurrent.futures import Future
+from typing import Dict, Any, List, Sequence, Set, Tuple
 from web3 import Web3
+from eth_utils import function_signature_to_4byte_selector
 from eth_account import Account
 
 from config import (
     TOKEN_ADDRESSES,
-    FAUCET_ADDRESSES,
     STAKING_ADDRESSES,
     SWAP_ADDRESSES,
     SWAP_PAIRS,
     MIN_BALANCE,
-    SWAP_PERCENTAGE,
-    STAKE_PERCENTAGE,
+    SWAP_RATIO,
+    STAKE_RATIO,
+    SEQ_PCT,
+    POOL_STAKES,
+    GAS_LIMIT,
+    TX_CONFIRMATIONS,
     TOKEN_ABI,
-    MINT_TOKEN_ABI,
-    STAKE_TOKEN_ABI,
-    SWAP_ATH_ABI,
-    SWAP_VANA_ABI,
+    SWAP_DISPATCH,
+    STAKE_SELECTOR,
+    MINT_SELECTOR,
+    APPROVE_SELECTOR,
+    MAX_UINT256,
+    APPROVALS_FILE,
 )
 from utils import (
     get_token_contract,
-    get_token_balance,
+    get_token_meta,
+    get_token_balances,
+    get_chain_id,
+    get_fee_params,
+    load_approvals,
+    save_approvals,
     format_amount,
-    build_tx_params,
+    format_token_amount,
     send_transaction,
+    send_transactions_parallel,
+    wait_for_transactions,
+    TxQueue,
+    NonceManager,
 )
 
 # Configure logging
@@ -40,6 +55,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# One executed transaction: (operation, token, target, amount, tx_hash), where target is
+# the spender, pool or swap destination token, and None for mints
+TxResult = Tuple[str, str, Any, int, str]
+
+class _LazyStr:
+    """Defer an expensive log argument until the record is actually formatted."""
+
+    def __init__(self, func, *args, **kwargs):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+    def __str__(self) -> str:
+        return self.func(*self.args, **self.kwargs)
+
 class MaitrixBot:
     """Bot for automating mint → swap → stake operations on MAITRIX testnet."""
 
@@ -54,26 +84,211 @@ class MaitrixBot:
         for symbol in TOKEN_ADDRESSES:
             self.token_contracts[symbol] = get_token_contract(web3, symbol, TOKEN_ABI)
 
-        # Initialize token balances
-        self.token_balances = {}
+        # Precompute the router address and function selector for every supported swap pair
+        self._swap_routers = {}
+        self._swap_selectors = {}
+        for (from_token, to_token), function_name in SWAP_DISPATCH.items():
+            self._swap_routers[(from_token, to_token)] = SWAP_ADDRESSES[f"{from_token}_TO_{to_token}"]
+            self._swap_selectors[(from_token, to_token)] = function_signature_to_4byte_selector(
+                f"{function_name}(uint256)"
+            )
+
+        # Nonces are tracked locally instead of being queried for every transaction
+        self._nonces = NonceManager(web3, self.address)
+
+        # Pipelined transactions are posted by a background sender in nonce order
+        self._tx_queue = TxQueue(web3)
+
+        # Token state is kept as parallel lists indexed by the fixed token order;
+        # decimals never change, so they are fetched once
+        self._symbols = tuple(TOKEN_ADDRESSES)
+        self._idx = {symbol: i for i, symbol in enumerate(self._symbols)}
+        self._decimals: List[int] = [
+            get_token_meta(web3, self.token_contracts[symbol])[0] for symbol in self._symbols
+        ]
+
+        # Initialize token balances; tokens touched by a transaction are marked dirty
+        self._balances: List[int] = [0] * len(self._symbols)
+        self._formatted: List[str] = [""] * len(self._symbols)
+        self._dirty_tokens: Set[str] = set()
+
+        # Known allowances per (token, spender), so repeat approvals skip the allowance call.
+        # Max approvals from earlier runs are loaded from disk and never repeated.
+        self._approved: Dict[Tuple[str, str], int] = {}
+        saved_approvals = load_approvals(APPROVALS_FILE, get_chain_id(web3), self.address)
+        self._max_approved: Set[Tuple[str, str]] = set(saved_approvals)
+        for approval_key in self._max_approved:
+            self._approved[approval_key] = MAX_UINT256
+        # Queued max approvals, persisted once their receipts are confirmed
+        self._unconfirmed_approvals: List[Tuple[Tuple[str, str], Future]] = []
         self.update_all_balances()
 
-        logger.info(f"MaitrixBot initialized for address: {self.address}")
+        logger.info("MaitrixBot initialized for address: %s", self.address)
+
+    def balance_of(self, token_symbol: str) -> int:
+        """Return the last fetched raw balance of a token."""
+        return self._balances[self._idx[token_symbol]]
+
+    def decimals_of(self, token_symbol: str) -> int:
+        """Return the decimals of a token."""
+        return self._decimals[self._idx[token_symbol]]
+
+    def formatted_balance(self, token_symbol: str) -> str:
+        """Return the last fetched balance of a token formatted with its decimals."""
+        return self._formatted[self._idx[token_symbol]]
+
+    @property
+    def token_balances(self) -> Dict[str, Dict[str, Any]]:
+        """Snapshot of all balances as {symbol: {"balance", "decimals", "formatted"}}."""
+        return {
+            symbol: {"balance": balance, "decimals": decimals, "formatted": formatted}
+            for symbol, balance, decimals, formatted in zip(self._symbols, self._balances, self._decimals,
+                                                            self._formatted)
+        }
 
     def update_all_balances(self) -> None:
-        """Update balances for all tokens."""
-        for symbol, contract in self.token_contracts.items():
-            balance, decimals, _ = get_token_balance(self.web3, contract, self.address)
-            self.token_balances[symbol] = {
-                "balance": balance,
-                "decimals": decimals,
-                "formatted": format_amount(balance, decimals)
-            }
-            logger.info(f"Balance of {symbol}: {self.token_balances[symbol]['formatted']}")
-
-    def approve_token(self, token_symbol: str, spender_address: str, amount: int) -> Dict[str, Any]:
-        """Approve token spending."""
+        """Update balances for all tokens in a single multicall."""
+        self._update_balances(self._symbols)
+        self._dirty_tokens.clear()
+
+    def _portion(self, token_symbol: str, ratio: Tuple[int, int]) -> int:
+        """Return a (numerator, denominator) portion of a token balance using integer math."""
+        numerator, denominator = ratio
+        return self._balances[self._idx[token_symbol]] * numerator // denominator
+
+    def _invalidate(self, token_symbol: str) -> None:
+        """Mark a token whose balance was changed by a transaction."""
+        self._dirty_tokens.add(token_symbol)
+
+    def _refresh_dirty(self) -> None:
+        """Update balances only for tokens touched since the last refresh."""
+        if self._dirty_tokens:
+            self._update_balances([s for s in self._symbols if s in self._dirty_tokens])
+            self._dirty_tokens.clear()
+
+    def _update_balances(self, symbols: Sequence[str]) -> None:
+        """Update balances for the given tokens in a single multicall."""
+        results = get_token_balances(self.web3, [(symbol, self.address) for symbol in symbols])
+
+        for symbol, (balance, _, _) in zip(symbols, results):
+            i = self._idx[symbol]
+            if balance is None:
+                logger.warning("Failed to fetch balance of %s, keeping last known value", symbol)
+            else:
+                self._balances[i] = balance
+
+            self._formatted[i] = format_amount(self._balances[i], self._decimals[i])
+            logger.info("Balance of %s: %s", symbol, self._formatted[i])
+
+    def _prepare_tx_context(self) -> Dict[str, int]:
+        """Build a transaction template with fees, chain ID and gas limit."""
+        return {
+            **get_fee_params(self.web3),
+            "chainId": get_chain_id(self.web3),
+            "gas": GAS_LIMIT,
+        }
+
+    def _build_raw_tx(self, to_address: str, data: bytes, tx_context: Dict[str, int] = None) -> Dict[str, Any]:
+        """Build a transaction from precomputed calldata.
+
+        This bypasses contract.build_transaction and its ABI lookup and
+        validation; the nonce is assigned when the transaction is sent.
+        """
+        if tx_context is None:
+            tx_context = self._prepare_tx_context()
+
+        return {"to": to_address, "data": data, "value": 0, **tx_context}
+
+    def _send(self, tx_data: Dict[str, Any], wait: bool = True) -> Any:
+        """Assign the next local nonce, then sign and send the transaction.
+
+        Returns the receipt, or if wait is False, queues the
+        transaction and returns a Future for its hash; the approve,
+        mint, swap and stake operations pass wait through to here.
+        """
+        tx_data["nonce"] = self._nonces.next()
+
+        try:
+            if not wait:
+                return self._tx_queue.submit(self.account.sign_transaction(tx_data).rawTransaction)
+            return send_transaction(self.web3, self.account, tx_data)
+        except Exception:
+            self._nonces.resync()
+            raise
+
+    def _wait_sent(self, futures: List[Future]) -> List[Any]:
+        """Wait until queued transactions have been posted and return their hashes."""
+        try:
+            return [tx_future.result() for tx_future in futures]
+        except Exception:
+            # Nothing after the failed send was posted, so the node's count is the next free nonce
+            self._nonces.resync()
+            self._tx_queue.reset()
+            self._forget_unconfirmed_approvals()
+            raise
+
+    def _forget_unconfirmed_approvals(self) -> None:
+        """Drop queued max approvals that will not be confirmed from the known allowances."""
+        for approval_key, _ in self._unconfirmed_approvals:
+            self._approved.pop(approval_key, None)
+        self._unconfirmed_approvals = []
+
+    def _collect_pending(self, pending: List[Tuple[Tuple[str, str, Any, int], Future]],
+                         results: List[TxResult]) -> None:
+        """Wait for pipelined transactions together and record them in the results."""
+        tx_hashes = self._wait_sent([tx_future for _, tx_future in pending] +
+                                    [tx_future for _, tx_future in self._unconfirmed_approvals])
+        try:
+            receipts = wait_for_transactions(self.web3, tx_hashes, TX_CONFIRMATIONS)
+        except Exception:
+            self._forget_unconfirmed_approvals()
+            raise
+
+        for (record, _), receipt in zip(pending, receipts):
+            results.append(record + (receipt["transactionHash"].hex(),))
+
+        approvals, self._unconfirmed_approvals = self._unconfirmed_approvals, []
+        for approval_key, _ in approvals:
+            self._save_max_approval(approval_key)
+
+    def _log_results(self, results: List[TxResult]) -> None:
+        """Log all transactions of a cycle as one compact JSON line."""
+        logger.info("Results: %s", _LazyStr(json.dumps, results, separators=(",", ":")))
+
+    def _send_parallel(self, txs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Send transactions concurrently and return their receipts in order."""
+        return send_transactions_parallel(self.web3, self.account, txs, nonce_manager=self._nonces)
+
+    def _record_approval(self, token_symbol: str, spender_address: str, allowance: int,
+                         confirmed: bool = True) -> None:
+        """Remember a known allowance, persisting confirmed max approvals for later runs."""
+        approval_key = (token_symbol, spender_address)
+        self._approved[approval_key] = allowance
+
+        if allowance == MAX_UINT256 and confirmed:
+            self._save_max_approval(approval_key)
+
+    def _save_max_approval(self, approval_key: Tuple[str, str]) -> None:
+        """Persist a confirmed max approval so later runs skip it."""
+        if approval_key not in self._max_approved:
+            self._max_approved.add(approval_key)
+            save_approvals(APPROVALS_FILE, get_chain_id(self.web3), self.address, self._max_approved)
+
+    def _build_approval(self, token_symbol: str, spender_address: str, amount: int,
+                        tx_context: Dict[str, int] = None, approve_max: bool = False) -> Dict[str, Any]:
+        """Build an approve transaction, or return None if the allowance already covers the amount.
+
+        With approve_max, the transaction approves MAX_UINT256 instead of the
+        exact amount, so the pair never needs approving again.
+        """
         token_contract = self.token_contracts[token_symbol]
+        approval_key = (token_symbol, spender_address)
+
+        # Skip the allowance call if this pair was just approved
+        known_allowance = self._approved.get(approval_key, 0)
+        if known_allowance >= amount:
+            logger.info("Approval not needed for %s. Known allowance: %s", token_symbol, known_allowance)
+            return None
 
         # Check if approval is needed
         current_allowance = token_contract.functions.allowance(
@@ -81,197 +296,166 @@ class MaitrixBot:
         ).call()
 
         if current_allowance >= amount:
-            logger.info(f"Approval not needed for {token_symbol}. Current allowance: {current_allowance}")
+            self._record_approval(token_symbol, spender_address, current_allowance)
+            logger.info("Approval not needed for %s. Current allowance: %s", token_symbol, current_allowance)
             return None
 
-        logger.info(f"Approving {format_amount(amount, self.token_balances[token_symbol]['decimals'])} "
-                   f"{token_symbol} for spender {spender_address}")
+        if approve_max:
+            amount = MAX_UINT256
+            logger.info("Approving unlimited %s for spender %s", token_symbol, spender_address)
+        else:
+            logger.info("Approving %s %s for spender %s",
+                        _LazyStr(format_token_amount, self.web3, token_symbol, amount),
+                        token_symbol, spender_address)
 
-        tx_data = token_contract.functions.approve(
-            spender_address, amount
-        ).build_transaction({
-            "from": self.address,
-            "nonce": self.web3.eth.get_transaction_count(self.address),
-        })
+        data = APPROVE_SELECTOR + bytes(12) + bytes.fromhex(spender_address[2:]) + amount.to_bytes(32, "big")
+        return self._build_raw_tx(token_contract.address, data, tx_context)
 
-        return send_transaction(self.web3, self.account, tx_data)
+    def approve_token(self, token_symbol: str, spender_address: str, amount: int,
+                      tx_context: Dict[str, int] = None, wait: bool = True,
+                      approve_max: bool = False) -> Dict[str, Any]:
+        """Approve token spending."""
+        tx_data = self._build_approval(token_symbol, spender_address, amount, tx_context, approve_max)
+        if tx_data is None:
+            return None
 
-    def mint_token(self, token_symbol: str, amount: int) -> Dict[str, Any]:
+        result = self._send(tx_data, wait)
+        self._record_approval(token_symbol, spender_address, MAX_UINT256 if approve_max else amount,
+                              confirmed=wait)
+        if approve_max and not wait:
+            self._unconfirmed_approvals.append(((token_symbol, spender_address), result))
+        return result
+
+    def _spend_allowance(self, token_symbol: str, spender_address: str, amount: int) -> None:
+        """Deduct allowance used by a swap or stake from the known allowance."""
+        approval_key = (token_symbol, spender_address)
+        if approval_key in self._approved:
+            self._approved[approval_key] = max(self._approved[approval_key] - amount, 0)
+
+    def mint_token(self, token_symbol: str, amount: int, tx_context: Dict[str, int] = None,
+                   wait: bool = True) -> Dict[str, Any]:
         """Mint tokens if possible."""
         if token_symbol not in TOKEN_ADDRESSES:
-            logger.warning(f"Unknown token symbol: {token_symbol}")
+            logger.warning("Unknown token symbol: %s", token_symbol)
             return None
 
-        # Get contract with mint ABI
-        token_address = TOKEN_ADDRESSES[token_symbol]
-        token_contract = self.web3.eth.contract(
-            address=Web3.to_checksum_address(token_address),
-            abi=MINT_TOKEN_ABI
-        )
+        logger.info("Minting %s %s", _LazyStr(format_token_amount, self.web3, token_symbol, amount),
+                    token_symbol)
 
-        try:
-            # Check if contract has mint function
-            token_contract.functions.mint
-        except AttributeError:
-            logger.warning(f"Token {token_symbol} does not have a mint function")
-            return None
+        tx_data = self._build_raw_tx(TOKEN_ADDRESSES[token_symbol], MINT_SELECTOR + amount.to_bytes(32, "big"),
+                                     tx_context)
 
-        logger.info(f"Minting {format_amount(amount, self.token_balances[token_symbol]['decimals'])} "
-                   f"{token_symbol}")
+        result = self._send(tx_data, wait)
+        self._invalidate(token_symbol)
+        return result
 
-        tx_data = token_contract.functions.mint(amount).build_transaction({
-            "from": self.address,
-            "nonce": self.web3.eth.get_transaction_count(self.address),
-        })
-
-        return send_transaction(self.web3, self.account, tx_data)
-
-    def swap_token(self, from_token: str, to_token: str, amount: int) -> Dict[str, Any]:
+    def swap_token(self, from_token: str, to_token: str, amount: int,
+                   tx_context: Dict[str, int] = None, wait: bool = True) -> Dict[str, Any]:
         """Swap tokens."""
-        swap_key = f"{from_token}_TO_{to_token}"
+        swap_pair = (from_token, to_token)
 
-        if swap_key not in SWAP_ADDRESSES:
-            logger.warning(f"No swap router found for {from_token} to {to_token}")
+        if swap_pair not in self._swap_selectors:
+            logger.warning("No swap router found for %s to %s", from_token, to_token)
             return None
 
-        router_address = SWAP_ADDRESSES[swap_key]
-
         # Approve token for swap
-        self.approve_token(from_token, router_address, amount)
-
-        # Get router contract with appropriate ABI based on token pair
-        abi = None
-        function_name = None
-
-        if from_token == "ATH" and to_token == "AUSD":
-            abi = SWAP_ATH_ABI
-            function_name = "swapATHtoAUSD"
-        elif from_token == "VANA" and to_token == "VANAUSD":
-            abi = SWAP_VANA_ABI
-            function_name = "swapVANAtoVANAUSD"
-        else:
-            # Default ABI for other pairs
-            abi = [
-                {
-                    "name": "mint",
-                    "type": "function",
-                    "inputs": [{"name": "amount", "type": "uint256"}],
-                    "outputs": []
-                }
-            ]
-            function_name = "mint"
-
-        router_contract = self.web3.eth.contract(
-            address=Web3.to_checksum_address(router_address),
-            abi=abi
-        )
-
-        logger.info(f"Swapping {format_amount(amount, self.token_balances[from_token]['decimals'])} "
-                   f"{from_token} to {to_token}")
-
-        # Call the appropriate function based on token pair
-        function = getattr(router_contract.functions, function_name)
-        tx_data = function(amount).build_transaction({
-            "from": self.address,
-            "nonce": self.web3.eth.get_transaction_count(self.address),
-        })
-
-        return send_transaction(self.web3, self.account, tx_data)
-
-    def stake_token(self, token_symbol: str, amount: int) -> Dict[str, Any]:
+        self.approve_token(from_token, self._swap_routers[swap_pair], amount, tx_context, wait,
+                           approve_max=True)
+
+        logger.info("Swapping %s %s to %s", _LazyStr(format_token_amount, self.web3, from_token, amount),
+                    from_token, to_token)
+
+        tx_data = self._build_raw_tx(self._swap_routers[swap_pair],
+                                     self._swap_selectors[swap_pair] + amount.to_bytes(32, "big"), tx_context)
+
+        result = self._send(tx_data, wait)
+        self._spend_allowance(from_token, self._swap_routers[swap_pair], amount)
+        self._invalidate(from_token)
+        self._invalidate(to_token)
+        return result
+
+    def stake_token(self, token_symbol: str, amount: int, tx_context: Dict[str, int] = None,
+                    wait: bool = True) -> Dict[str, Any]:
         """Stake tokens."""
         if token_symbol not in STAKING_ADDRESSES:
-            logger.warning(f"No staking pool found for {token_symbol}")
+            logger.warning("No staking pool found for %s", token_symbol)
             return None
 
         staking_address = STAKING_ADDRESSES[token_symbol]
 
         # Approve token for staking
-        self.approve_token(token_symbol, staking_address, amount)
-
-        # Get staking contract
-        staking_contract = self.web3.eth.contract(
-            address=Web3.to_checksum_address(staking_address),
-            abi=STAKE_TOKEN_ABI
-        )
-
-        logger.info(f"Staking {format_amount(amount, self.token_balances[token_symbol]['decimals'])} "
-                   f"{token_symbol}")
-
-        tx_data = staking_contract.functions.stake(amount).build_transaction({
-            "from": self.address,
-            "nonce": self.web3.eth.get_transaction_count(self.address),
-        })
-
-        return send_transaction(self.web3, self.account, tx_data)
-
-    def run_auto_cycle(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Run the full mint → swap → stake cycle automatically."""
-        results = {
-            "mint": [],
-            "swap": [],
-            "stake": []
-        }
+        self.approve_token(token_symbol, staking_address, amount, tx_context, wait, approve_max=True)
+
+        logger.info("Staking %s %s", _LazyStr(format_token_amount, self.web3, token_symbol, amount),
+                    token_symbol)
+
+        tx_data = self._build_raw_tx(staking_address, STAKE_SELECTOR + amount.to_bytes(32, "big"), tx_context)
+
+        result = self._send(tx_data, wait)
+        self._spend_allowance(token_symbol, staking_address, amount)
+        self._invalidate(token_symbol)
+        return result
+
+    def run_auto_cycle(self) -> List[TxResult]:
+        """Run the full mint → swap → stake cycle automatically.
+
+        Returns one (operation, token, target, amount, tx_hash) tuple per transaction.
+        """
+        results: List[TxResult] = []
 
         # Update balances
         self.update_all_balances()
 
+        # Gas price, chain ID and gas limit are constant for the whole cycle
+        tx_context = self._prepare_tx_context()
+
         # 1. Mint tokens if balance is low
         for token_symbol in TOKEN_ADDRESSES:
-            balance = self.token_balances[token_symbol]["balance"]
+            balance = self.balance_of(token_symbol)
             min_balance = MIN_BALANCE.get(token_symbol, 0)
 
             if balance < min_balance:
                 mint_amount = min_balance * 2  # Mint double the minimum balance
-                mint_result = self.mint_token(token_symbol, mint_amount)
+                mint_result = self.mint_token(token_symbol, mint_amount, tx_context)
 
                 if mint_result:
-                    results["mint"].append({
-                        "token": token_symbol,
-                        "amount": mint_amount,
-                        "tx_hash": mint_result["transactionHash"].hex()
-                    })
+                    results.append(("mint", token_symbol, None, mint_amount,
+                                    mint_result["transactionHash"].hex()))
 
         # Update balances after minting
-        self.update_all_balances()
+        self._refresh_dirty()
 
         # 2. Swap tokens
         for from_token, to_token in SWAP_PAIRS.items():
-            balance = self.token_balances[from_token]["balance"]
+            balance = self.balance_of(from_token)
 
             if balance > 0:
-                swap_amount = int(balance * SWAP_PERCENTAGE)
-                swap_result = self.swap_token(from_token, to_token, swap_amount)
+                swap_amount = self._portion(from_token, SWAP_RATIO)
+                swap_result = self.swap_token(from_token, to_token, swap_amount, tx_context)
 
                 if swap_result:
-                    results["swap"].append({
-                        "from_token": from_token,
-                        "to_token": to_token,
-                        "amount": swap_amount,
-                        "tx_hash": swap_result["transactionHash"].hex()
-                    })
+                    results.append(("swap", from_token, to_token, swap_amount,
+                                    swap_result["transactionHash"].hex()))
 
         # Update balances after swapping
-        self.update_all_balances()
+        self._refresh_dirty()
 
         # 3. Stake tokens
         for token_symbol in STAKING_ADDRESSES:
-            balance = self.token_balances[token_symbol]["balance"]
+            balance = self.balance_of(token_symbol)
 
             if balance > 0:
-                stake_amount = int(balance * STAKE_PERCENTAGE)
-                stake_result = self.stake_token(token_symbol, stake_amount)
+                stake_amount = self._portion(token_symbol, STAKE_RATIO)
+                stake_result = self.stake_token(token_symbol, stake_amount, tx_context)
 
                 if stake_result:
-                    results["stake"].append({
-                        "token": token_symbol,
-                        "amount": stake_amount,
-                        "tx_hash": stake_result["transactionHash"].hex()
-                    })
+                    results.append(("stake", token_symbol, STAKING_ADDRESSES[token_symbol], stake_amount,
+                                    stake_result["transactionHash"].hex()))
 
         # Final balance update
-        self.update_all_balances()
+        self._refresh_dirty()
 
+        self._log_results(results)
         return results
 
     def run_single_operation(self, operation: str, token_symbol: str, amount: int = None) -> Dict[str, Any]:
@@ -290,9 +474,8 @@ class MaitrixBot:
             if operation == "mint":
                 amount = MIN_BALANCE.get(token_symbol, 0) * 2
             else:
-                balance = self.token_balances[token_symbol]["balance"]
-                percentage = SWAP_PERCENTAGE if operation == "swap" else STAKE_PERCENTAGE
-                amount = int(balance * percentage)
+                ratio = SWAP_RATIO if operation == "swap" else STAKE_RATIO
+                amount = self._portion(token_symbol, ratio)
 
         # Execute operation
         if operation == "mint":
@@ -305,192 +488,124 @@ class MaitrixBot:
         else:  # stake
             return self.stake_token(token_symbol, amount)
 
-    def run_maitrix_sequence(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Run the specific sequence of operations based on transaction history."""
-        results = {
-            "approve": [],
-            "swap": [],
-            "stake": []
-        }
+    def run_maitrix_sequence(self) -> List[TxResult]:
+        """Run the specific sequence of operations based on transaction history.
+
+        Returns one (operation, token, target, amount, tx_hash) tuple
+        per transaction.
+        """
+        results: List[TxResult] = []
 
         # Update balances
         self.update_all_balances()
 
+        # Gas price, chain ID and gas limit are constant for the whole sequence
+        tx_context = self._prepare_tx_context()
+
+        # Steps 1-3 touch independent balances, so submit them together
+        pending = []
+
         # 1. Approve VANA for swap
-        vana_amount = int(float(self.token_balances["VANA"]["balance"]) * 0.4)
+        vana_amount = self._portion("VANA", SEQ_PCT["VANA_APPROVE"])
         if vana_amount > 0:
-            vana_approve_result = self.approve_token("VANA", SWAP_ADDRESSES["VANA_TO_VANAUSD"], vana_amount)
-            if vana_approve_result:
-                results["approve"].append({
-                    "token": "VANA",
-                    "spender": SWAP_ADDRESSES["VANA_TO_VANAUSD"],
-                    "amount": vana_amount,
-                    "tx_hash": vana_approve_result["transactionHash"].hex()
-                })
+            vana_approve_future = self.approve_token("VANA", SWAP_ADDRESSES["VANA_TO_VANAUSD"], vana_amount,
+                                                   tx_context, wait=False)
+            if vana_approve_future:
+                pending.append((("approve", "VANA", SWAP_ADDRESSES["VANA_TO_VANAUSD"], vana_amount),
+                                vana_approve_future))
 
         # 2. Stake AUSD
-        ausd_amount = int(float(self.token_balances["AUSD"]["balance"]) * 0.5)
+        ausd_amount = self._portion("AUSD", SEQ_PCT["AUSD_STAKE"])
         if ausd_amount > 0:
-            ausd_stake_result = self.stake_token("AUSD", ausd_amount)
-            if ausd_stake_result:
-                results["stake"].append({
-                    "token": "AUSD",
-                    "pool": STAKING_ADDRESSES["AUSD"],
-                    "amount": ausd_amount,
-                    "tx_hash": ausd_stake_result["transactionHash"].hex()
-                })
+            ausd_stake_future = self.stake_token("AUSD", ausd_amount, tx_context, wait=False)
+            if ausd_stake_future:
+                pending.append((("stake", "AUSD", STAKING_ADDRESSES["AUSD"], ausd_amount), ausd_stake_future))
 
         # 3. Swap ATH to AUSD
-        ath_amount = int(float(self.token_balances["ATH"]["balance"]) * 0.2)
+        ath_amount = self._portion("ATH", SEQ_PCT["ATH_SWAP"])
         if ath_amount > 0:
-            ath_swap_result = self.swap_token("ATH", "AUSD", ath_amount)
-            if ath_swap_result:
-                results["swap"].append({
-                    "from_token": "ATH",
-                    "to_token": "AUSD",
-                    "amount": ath_amount,
-                    "tx_hash": ath_swap_result["transactionHash"].hex()
-                })
+            ath_swap_future = self.swap_token("ATH", "AUSD", ath_amount, tx_context, wait=False)
+            if ath_swap_future:
+                pending.append((("swap", "ATH", "AUSD", ath_amount), ath_swap_future))
+
+        self._collect_pending(pending, results)
 
         # Update balances after swap
-        self.update_all_balances()
+        self._refresh_dirty()
 
         # 4. Swap VANA to VANAUSD
-        vana_amount = int(float(self.token_balances["VANA"]["balance"]) * 0.2)
+        vana_amount = self._portion("VANA", SEQ_PCT["VANA_SWAP"])
         if vana_amount > 0:
-            vana_swap_result = self.swap_token("VANA", "VANAUSD", vana_amount)
+            vana_swap_result = self.swap_token("VANA", "VANAUSD", vana_amount, tx_context)
             if vana_swap_result:
-                results["swap"].append({
-                    "from_token": "VANA",
-                    "to_token": "VANAUSD",
-                    "amount": vana_amount,
-                    "tx_hash": vana_swap_result["transactionHash"].hex()
-                })
+                results.append(("swap", "VANA", "VANAUSD", vana_amount, vana_swap_result["transactionHash"].hex()))
 
         # Update balances after swap
-        self.update_all_balances()
+        self._refresh_dirty()
+
+        # Steps 5-10 are mutually independent, so submit them together
+        pending = []
 
         # 5. Stake VUSD
-        vusd_amount = int(float(self.token_balances["VUSD"]["balance"]) * 0.5)
+        vusd_amount = self._portion("VUSD", SEQ_PCT["VUSD_STAKE"])
         if vusd_amount > 0:
-            vusd_stake_result = self.stake_token("VUSD", vusd_amount)
-            if vusd_stake_result:
-                results["stake"].append({
-                    "token": "VUSD",
-                    "pool": STAKING_ADDRESSES["VUSD"],
-                    "amount": vusd_amount,
-                    "tx_hash": vusd_stake_result["transactionHash"].hex()
-                })
+            vusd_stake_future = self.stake_token("VUSD", vusd_amount, tx_context, wait=False)
+            if vusd_stake_future:
+                pending.append((("stake", "VUSD", STAKING_ADDRESSES["VUSD"], vusd_amount), vusd_stake_future))
 
         # 6. Stake AUSD again
-        ausd_amount = int(float(self.token_balances["AUSD"]["balance"]) * 0.5)
+        ausd_amount = self._portion("AUSD", SEQ_PCT["AUSD_STAKE"])
         if ausd_amount > 0:
-            ausd_stake_result = self.stake_token("AUSD", ausd_amount)
-            if ausd_stake_result:
-                results["stake"].append({
-                    "token": "AUSD",
-                    "pool": STAKING_ADDRESSES["AUSD"],
-                    "amount": ausd_amount,
-                    "tx_hash": ausd_stake_result["transactionHash"].hex()
-                })
-
-        # 7. Stake in POOL1
-        # For simplicity, we'll use ATH for this pool
-        ath_amount = int(float(self.token_balances["ATH"]["balance"]) * 0.1)
-        if ath_amount > 0:
-            # Approve ATH for POOL1
-            self.approve_token("ATH", STAKING_ADDRESSES["POOL1"], ath_amount)
-
-            # Create a contract for POOL1
-            pool1_contract = self.web3.eth.contract(
-                address=Web3.to_checksum_address(STAKING_ADDRESSES["POOL1"]),
-                abi=STAKE_TOKEN_ABI
-            )
-
-            # Stake ATH in POOL1
-            tx_data = pool1_contract.functions.stake(ath_amount).build_transaction({
-                "from": self.address,
-                "nonce": self.web3.eth.get_transaction_count(self.address),
-            })
-
-            pool1_stake_result = send_transaction(self.web3, self.account, tx_data)
-            if pool1_stake_result:
-                results["stake"].append({
-                    "token": "ATH",
-                    "pool": STAKING_ADDRESSES["POOL1"],
-                    "amount": ath_amount,
-                    "tx_hash": pool1_stake_result["transactionHash"].hex()
-                })
-
-        # 8. Stake in POOL2
-        # For simplicity, we'll use ATH for this pool too
-        ath_amount = int(float(self.token_balances["ATH"]["balance"]) * 0.1)
-        if ath_amount > 0:
-            # Approve ATH for POOL2
-            self.approve_token("ATH", STAKING_ADDRESSES["POOL2"], ath_amount)
-
-            # Create a contract for POOL2
-            pool2_contract = self.web3.eth.contract(
-                address=Web3.to_checksum_address(STAKING_ADDRESSES["POOL2"]),
-                abi=STAKE_TOKEN_ABI
-            )
-
-            # Stake ATH in POOL2
-            tx_data = pool2_contract.functions.stake(ath_amount).build_transaction({
-                "from": self.address,
-                "nonce": self.web3.eth.get_transaction_count(self.address),
-            })
-
-            pool2_stake_result = send_transaction(self.web3, self.account, tx_data)
-            if pool2_stake_result:
-                results["stake"].append({
-                    "token": "ATH",
-                    "pool": STAKING_ADDRESSES["POOL2"],
-                    "amount": ath_amount,
-                    "tx_hash": pool2_stake_result["transactionHash"].hex()
-                })
+            ausd_stake_future = self.stake_token("AUSD", ausd_amount, tx_context, wait=False)
+            if ausd_stake_future:
+                pending.append((("stake", "AUSD", STAKING_ADDRESSES["AUSD"], ausd_amount), ausd_stake_future))
 
         # 9. Approve VANAUSD
-        vanausd_amount = int(float(self.token_balances["VANAUSD"]["balance"]) * 0.5)
+        vanausd_amount = self._portion("VANAUSD", SEQ_PCT["VANAUSD_APPROVE"])
         if vanausd_amount > 0:
-            vanausd_approve_result = self.approve_token("VANAUSD", TOKEN_ADDRESSES["VANAUSD"], vanausd_amount)
-            if vanausd_approve_result:
-                results["approve"].append({
-                    "token": "VANAUSD",
-                    "spender": TOKEN_ADDRESSES["VANAUSD"],
-                    "amount": vanausd_amount,
-                    "tx_hash": vanausd_approve_result["transactionHash"].hex()
-                })
-
-        # 10. Stake in POOL3
-        # For simplicity, we'll use ATH for this pool too
-        ath_amount = int(float(self.token_balances["ATH"]["balance"]) * 0.1)
-        if ath_amount > 0:
-            # Approve ATH for POOL3
-            self.approve_token("ATH", STAKING_ADDRESSES["POOL3"], ath_amount)
-
-            # Create a contract for POOL3
-            pool3_contract = self.web3.eth.contract(
-                address=Web3.to_checksum_address(STAKING_ADDRESSES["POOL3"]),
-                abi=STAKE_TOKEN_ABI
-            )
-
-            # Stake ATH in POOL3
-            tx_data = pool3_contract.functions.stake(ath_amount).build_transaction({
-                "from": self.address,
-                "nonce": self.web3.eth.get_transaction_count(self.address),
-            })
-
-            pool3_stake_result = send_transaction(self.web3, self.account, tx_data)
-            if pool3_stake_result:
-                results["stake"].append({
-                    "token": "ATH",
-                    "pool": STAKING_ADDRESSES["POOL3"],
-                    "amount": ath_amount,
-                    "tx_hash": pool3_stake_result["transactionHash"].hex()
-                })
+            vanausd_approve_future = self.approve_token("VANAUSD", TOKEN_ADDRESSES["VANAUSD"],
+                                                      vanausd_amount, tx_context, wait=False)
+            if vanausd_approve_future:
+                pending.append((("approve", "VANAUSD", TOKEN_ADDRESSES["VANAUSD"], vanausd_amount),
+                                vanausd_approve_future))
+
+        # 7, 8, 10. Approve and stake in POOL1, POOL2 and POOL3
+        # The pools are independent, so their transactions are sent in parallel
+        pool_txs = []
+        pool_stakes = []
+        for pool_name, token_symbol, ratio in POOL_STAKES:
+            amount = self._portion(token_symbol, ratio)
+            if amount <= 0:
+                continue
+
+            pool_address = STAKING_ADDRESSES[pool_name]
+            approve_tx = self._build_approval(token_symbol, pool_address, amount, tx_context, approve_max=True)
+            if approve_tx:
+                pool_txs.append(approve_tx)
+
+            pool_txs.append(self._build_raw_tx(pool_address, STAKE_SELECTOR + amount.to_bytes(32, "big"), tx_context))
+            pool_stakes.append((len(pool_txs) - 1, approve_tx is not None, pool_address,
+                                ("stake", token_symbol, STAKING_ADDRESSES[pool_name], amount)))
+
+        if pool_txs:
+            # The pool transactions take the next nonces, so make sure everything queued before them was posted
+            self._wait_sent([tx_future for _, tx_future in pending] +
+                            [tx_future for _, tx_future in self._unconfirmed_approvals])
+            receipts = self._send_parallel(pool_txs)
+
+            for index, approved, pool_address, record in pool_stakes:
+                _, token_symbol, _, amount = record
+                if approved:
+                    self._record_approval(token_symbol, pool_address, MAX_UINT256)
+                self._spend_allowance(token_symbol, pool_address, amount)
+                self._invalidate(token_symbol)
+
+                results.append(record + (receipts[index]["transactionHash"].hex(),))
+
+        self._collect_pending(pending, results)
 
         # Final balance update
-        self.update_all_balances()
+        self._refresh_dirty()
 
+        self._log_results(results)
         return results
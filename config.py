@@ -7,6 +7,11 @@ Contains contract addresses, ABIs, and other settings.
 CHAIN_ID = 421614  # Arbitrum Sepolia
 RPC_URL = "https://sepolia-rollup.arbitrum.io/rpc"
 
+# RPC connection settings
+RPC_TIMEOUT = 10  # seconds
+RPC_POOL_SIZE = 16
+RPC_MAX_RETRIES = 3
+
 # Gas settings
 GAS_PRICE_GWEI = 1.5
 GAS_LIMIT = 3000000
@@ -14,16 +19,34 @@ GAS_LIMIT = 3000000
 # Transaction settings
 TX_CONFIRMATIONS = 2
 TX_TIMEOUT = 300  # seconds
+TX_POLL_MIN_INTERVAL = 0.25  # seconds; receipt polling follows the observed block time within these bounds
+TX_POLL_MAX_INTERVAL = 8  # seconds
+BLOCK_TIME_SAMPLE = 20  # blocks averaged to estimate the block time
+
+# All contract addresses below are EIP-55 checksummed, so they can be passed to web3 as-is
 
 # Token contract addresses
 TOKEN_ADDRESSES = {
-    "ATH": "0x1428444eacdc0fd115dd4318fce65b61cd1ef399",
-    "USDe": "0xf4be938070f59764c85face374f92a4670ff3877",
-    "LVLUSD": "0x8802b7bcf8eedcc9e1ba6c20e139bee89dd98e83",
-    "VANA": "0xbebf4e25652e7f23ccdcccaacb32004501c4bff8",
-    "AUSD": "0x78de28aabbd5198657b26a8dc9777f441551b477",
-    "VUSD": "0xc14a8e2fc341a97a57524000bf0f7f1ba4de4802",
-    "VANAUSD": "0x46a6585a0ad1750d37b4e6810eb59cbdf591dc30",
+    "ATH": "0x1428444Eacdc0Fd115dd4318FcE65B61Cd1ef399",
+    "USDe": "0xf4BE938070f59764C85fAcE374F92A4670ff3877",
+    "LVLUSD": "0x8802b7bcF8EedCc9E1bA6C20E139bEe89dd98E83",
+    "VANA": "0xBEbF4E25652e7F23CCdCCcaaCB32004501c4BfF8",
+    "AUSD": "0x78De28aABBD5198657B26A8dc9777f441551B477",
+    "VUSD": "0xc14A8E2Fc341A97a57524000bF0F7F1bA4de4802",
+    "VANAUSD": "0x46a6585a0Ad1750d37B4e6810EB59cBDf591Dc30",
+}
+
+# Token decimals, so they never need to be read on-chain.
+# All tokens use 18 decimals, matching the 10**18 units MIN_BALANCE assumes;
+# run `python main.py --verify-tokens <command>` to cross-check them against the chain.
+TOKEN_DECIMALS = {
+    "ATH": 18,
+    "USDe": 18,
+    "LVLUSD": 18,
+    "VANA": 18,
+    "AUSD": 18,
+    "VUSD": 18,
+    "VANAUSD": 18,
 }
 
 # Faucet contract addresses
@@ -35,18 +58,27 @@ FAUCET_ADDRESSES = {
 STAKING_ADDRESSES = {
     "AUSD": "0x054de909723ECda2d119E31583D40a52a332f85c",
     "VUSD": "0x5bb9Fa02a3DCCDB4E9099b48e8Ba5841D2e59d51",
-    "POOL1": "0x3988053b7c748023a1ae19a8ed4c1bf217932bdb",
-    "POOL2": "0x5de3fbd40d4c3892914c3b67b5b529d776a1483a",
-    "POOL3": "0x2608a88219bfb34519f635dd9ca2ae971539ca60",
+    "POOL1": "0x3988053b7c748023a1aE19a8ED4c1Bf217932bDB",
+    "POOL2": "0x5De3fBd40D4c3892914c3b67b5B529D776A1483A",
+    "POOL3": "0x2608A88219BFB34519f635Dd9Ca2Ae971539ca60",
 }
 
 # Swap/Router contract addresses
 SWAP_ADDRESSES = {
     "ATH_TO_AUSD": "0x2cFDeE1d5f04dD235AEA47E1aD2fB66e3A61C13e",
     "VANA_TO_VANAUSD": "0xEfbAE3A68b17a61f21C7809Edfa8Aa3CA7B2546f",
-    "MINT_SPECIAL": "0x3dcaca90a714498624067948c092dd0373f08265",
+    "MINT_SPECIAL": "0x3dCACa90A714498624067948C092Dd0373f08265",
 }
 
+# Multicall3 contract address (same address on every supported chain)
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Maximum ERC20 allowance; swaps and stakes approve it once per (token, spender)
+MAX_UINT256 = 2**256 - 1
+
+# Local file recording max approvals per wallet, so later runs skip them
+APPROVALS_FILE = ".maitrix_approvals.json"
+
 # Token pairs for swapping
 SWAP_PAIRS = {
     "ATH": "AUSD",
@@ -64,9 +96,26 @@ MIN_BALANCE = {
     "VANAUSD": 1 * 10**18,  # 1 VANAUSD
 }
 
-# Percentage of token balance to swap/stake (0.1 = 10%)
-SWAP_PERCENTAGE = 0.3
-STAKE_PERCENTAGE = 0.5
+# Portion of token balance to swap/stake as (numerator, denominator), so amounts stay integer
+SWAP_RATIO = (3, 10)  # 30%
+STAKE_RATIO = (1, 2)  # 50%
+
+# Portion of token balance used by each step of the MAITRIX sequence
+SEQ_PCT = {
+    "VANA_APPROVE": (2, 5),  # 40%
+    "AUSD_STAKE": (1, 2),  # 50%
+    "ATH_SWAP": (1, 5),  # 20%
+    "VANA_SWAP": (1, 5),  # 20%
+    "VUSD_STAKE": (1, 2),  # 50%
+    "VANAUSD_APPROVE": (1, 2),  # 50%
+}
+
+# Pool stakes of the MAITRIX sequence: (pool name, token symbol, portion of balance)
+POOL_STAKES = [
+    ("POOL1", "ATH", (1, 10)),  # 10%
+    ("POOL2", "ATH", (1, 10)),  # 10%
+    ("POOL3", "ATH", (1, 10)),  # 10%
+]
 
 # ABIs
 # Common ERC20 ABI with approve function
@@ -147,6 +196,36 @@ SPECIAL_FUNCTION_ABI = [
     }
 ]
 
+# Multicall3 aggregate3 ABI
+MULTICALL3_ABI = [
+    {
+        "name": "aggregate3",
+        "type": "function",
+        "stateMutability": "payable",
+        "inputs": [
+            {
+                "name": "calls",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"}
+                ]
+            }
+        ],
+        "outputs": [
+            {
+                "name": "returnData",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"}
+                ]
+            }
+        ]
+    }
+]
+
 # Combined ABIs for different contract types
 TOKEN_ABI = ERC20_ABI
 MINT_TOKEN_ABI = ERC20_ABI + MINT_ABI
@@ -154,5 +233,105 @@ STAKE_TOKEN_ABI = ERC20_ABI + STAKE_ABI
 SWAP_ATH_ABI = SPECIAL_FUNCTION_ABI[:1]  # swapATHtoAUSD
 SWAP_VANA_ABI = SPECIAL_FUNCTION_ABI[1:]  # swapVANAtoVANAUSD
 
+# 4-byte function selectors for calls whose calldata is built by hand
+BALANCE_OF_SELECTOR = bytes.fromhex("70a08231")  # balanceOf(address)
+DECIMALS_SELECTOR = bytes.fromhex("313ce567")    # decimals()
+SYMBOL_SELECTOR = bytes.fromhex("95d89b41")      # symbol()
+STAKE_SELECTOR = bytes.fromhex("a694fc3a")    # stake(uint256)
+MINT_SELECTOR = bytes.fromhex("a0712d68")     # mint(uint256)
+APPROVE_SELECTOR = bytes.fromhex("095ea7b3")  # approve(address,uint256)
+
+# Swap dispatch table: (from_token, to_token) -> router function name
+SWAP_DISPATCH = {
+    ("ATH", "AUSD"): "swapATHtoAUSD",
+    ("VANA", "VANAUSD"): "swapVANAtoVANAUSD",
+}
+
 # Explorer URL for transaction links
 EXPLORER_URL = "https://sepolia.arbiscan.io/tx/"
+
+# Multicall3 runtime bytecode (code hash 0xd5c15df6...770891), injected with an eth_call
+# state override on networks where Multicall3 is not deployed at MULTICALL3_ADDRESS
+MULTICALL3_BYTECODE = (
+    "0x"
+    "6080604052600436106100f35760003560e01c80634d2301cc1161008a578063a8b0574e11610059578063a8b0574e14"
+    "61025a578063bce38bd714610275578063c3077fa914610288578063ee82ac5e1461029b57600080fd5b80634d2301cc"
+    "146101ec57806372425d9d1461022157806382ad56cb1461023457806386d516e81461024757600080fd5b80633408e4"
+    "70116100c65780633408e47014610191578063399542e9146101a45780633e64a696146101c657806342cbb15c146101"
+    "d957600080fd5b80630f28c97d146100f8578063174dea711461011a578063252dba421461013a57806327e86d6e1461"
+    "015b575b600080fd5b34801561010457600080fd5b50425b6040519081526020015b60405180910390f35b61012d6101"
+    "28366004610a85565b6102ba565b6040516101119190610bbe565b61014d610148366004610a85565b6104ef565b6040"
+    "51610111929190610bd8565b34801561016757600080fd5b50437fffffffffffffffffffffffffffffffffffffffffff"
+    "ffffffffffffffffffffff0140610107565b34801561019d57600080fd5b5046610107565b6101b76101b2366004610c"
+    "60565b610690565b60405161011193929190610cba565b3480156101d257600080fd5b5048610107565b3480156101e5"
+    "57600080fd5b5043610107565b3480156101f857600080fd5b50610107610207366004610ce2565b73ffffffffffffff"
+    "ffffffffffffffffffffffffff163190565b34801561022d57600080fd5b5044610107565b61012d610242366004610a"
+    "85565b6106ab565b34801561025357600080fd5b5045610107565b34801561026657600080fd5b506040514181526020"
+    "01610111565b61012d610283366004610c60565b61085a565b6101b7610296366004610a85565b610a1a565b34801561"
+    "02a757600080fd5b506101076102b6366004610d18565b4090565b60606000828067ffffffffffffffff8111156102d8"
+    "576102d8610d31565b60405190808252806020026020018201604052801561031e57816020015b604080518082019091"
+    "5260008152606060208201528152602001906001900390816102f65790505b5092503660005b82811015610477576000"
+    "85828151811061034157610341610d60565b6020026020010151905087878381811061035d5761035d610d60565b9050"
+    "60200281019061036f9190610d8f565b6040810135958601959093506103886020850185610ce2565b73ffffffffffff"
+    "ffffffffffffffffffffffffffff16816103ac6060870187610dcd565b6040516103ba929190610e32565b6000604051"
+    "8083038185875af1925050503d80600081146103f7576040519150601f19603f3d011682016040523d82523d60006020"
+    "84013e6103fc565b606091505b50602080850191909152901515808452908501351761046d577f08c379a00000000000"
+    "0000000000000000000000000000000000000000000000600052602060045260176024527f4d756c746963616c6c333a"
+    "2063616c6c206661696c656400000000000000000060445260846000fd5b5050600101610325565b508234146104e657"
+    "6040517f08c379a000000000000000000000000000000000000000000000000000000000815260206004820152601a60"
+    "248201527f4d756c746963616c6c333a2076616c7565206d69736d6174636800000000000060448201526064015b6040"
+    "5180910390fd5b50505092915050565b436060828067ffffffffffffffff81111561050c5761050c610d31565b604051"
+    "90808252806020026020018201604052801561053f57816020015b606081526020019060019003908161052a5790505b"
+    "5091503660005b8281101561068657600087878381811061056257610562610d60565b90506020028101906105749190"
+    "610e42565b92506105836020840184610ce2565b73ffffffffffffffffffffffffffffffffffffffff166105a6602085"
+    "0185610dcd565b6040516105b4929190610e32565b6000604051808303816000865af19150503d80600081146105f157"
+    "6040519150601f19603f3d011682016040523d82523d6000602084013e6105f6565b606091505b508684815181106106"
+    "0957610609610d60565b602090810291909101015290508061067d576040517f08c379a0000000000000000000000000"
+    "00000000000000000000000000000000815260206004820152601760248201527f4d756c746963616c6c333a2063616c"
+    "6c206661696c656400000000000000000060448201526064016104dd565b50600101610546565b505050925092905056"
+    "5b43804060606106a086868661085a565b905093509350939050565b6060818067ffffffffffffffff8111156106c757"
+    "6106c7610d31565b60405190808252806020026020018201604052801561070d57816020015b60408051808201909152"
+    "60008152606060208201528152602001906001900390816106e55790505b5091503660005b828110156104e657600084"
+    "828151811061073057610730610d60565b6020026020010151905086868381811061074c5761074c610d60565b905060"
+    "200281019061075e9190610e76565b925061076d6020840184610ce2565b73ffffffffffffffffffffffffffffffffff"
+    "ffffff166107906040850185610dcd565b60405161079e929190610e32565b6000604051808303816000865af1915050"
+    "3d80600081146107db576040519150601f19603f3d011682016040523d82523d6000602084013e6107e0565b60609150"
+    "5b506020808401919091529015158083529084013517610851577f08c379a00000000000000000000000000000000000"
+    "0000000000000000000000600052602060045260176024527f4d756c746963616c6c333a2063616c6c206661696c6564"
+    "00000000000000000060445260646000fd5b50600101610714565b6060818067ffffffffffffffff8111156108765761"
+    "0876610d31565b6040519080825280602002602001820160405280156108bc57816020015b6040805180820190915260"
+    "008152606060208201528152602001906001900390816108945790505b5091503660005b82811015610a105760008482"
+    "815181106108df576108df610d60565b602002602001015190508686838181106108fb576108fb610d60565b90506020"
+    "0281019061090d9190610e42565b925061091c6020840184610ce2565b73ffffffffffffffffffffffffffffffffffff"
+    "ffff1661093f6020850185610dcd565b60405161094d929190610e32565b6000604051808303816000865af19150503d"
+    "806000811461098a576040519150601f19603f3d011682016040523d82523d6000602084013e61098f565b606091505b"
+    "506020830152151581528715610a07578051610a07576040517f08c379a0000000000000000000000000000000000000"
+    "00000000000000000000815260206004820152601760248201527f4d756c746963616c6c333a2063616c6c206661696c"
+    "656400000000000000000060448201526064016104dd565b506001016108c3565b5050509392505050565b6000806060"
+    "610a2b60018686610690565b919790965090945092505050565b60008083601f840112610a4b57600080fd5b50813567"
+    "ffffffffffffffff811115610a6357600080fd5b6020830191508360208260051b8501011115610a7e57600080fd5b92"
+    "50929050565b60008060208385031215610a9857600080fd5b823567ffffffffffffffff811115610aaf57600080fd5b"
+    "610abb85828601610a39565b90969095509350505050565b6000815180845260005b81811015610aed57602081850181"
+    "015186830182015201610ad1565b81811115610aff576000602083870101525b50601f017fffffffffffffffffffffff"
+    "ffffffffffffffffffffffffffffffffffffffffe0169290920160200192915050565b60008282518085526020808601"
+    "9550808260051b84010181860160005b84811015610bb1578583037fffffffffffffffffffffffffffffffffffffffff"
+    "ffffffffffffffffffffffe001895281518051151584528401516040858501819052610b9d81860183610ac7565b9a86"
+    "019a9450505090830190600101610b4f565b5090979650505050505050565b602081526000610bd16020830184610b32"
+    "565b9392505050565b600060408201848352602060408185015281855180845260608601915060608160051b87010193"
+    "5082870160005b82811015610c52577fffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffa0"
+    "888703018452610c40868351610ac7565b95509284019290840190600101610c06565b50939897505050505050505056"
+    "5b600080600060408486031215610c7557600080fd5b83358015158114610c8557600080fd5b9250602084013567ffff"
+    "ffffffffffff811115610ca157600080fd5b610cad86828701610a39565b9497909650939450505050565b8381528260"
+    "20820152606060408201526000610cd96060830184610b32565b95945050505050565b600060208284031215610cf457"
+    "600080fd5b813573ffffffffffffffffffffffffffffffffffffffff81168114610bd157600080fd5b60006020828403"
+    "1215610d2a57600080fd5b5035919050565b7f4e487b7100000000000000000000000000000000000000000000000000"
+    "000000600052604160045260246000fd5b7f4e487b710000000000000000000000000000000000000000000000000000"
+    "0000600052603260045260246000fd5b600082357fffffffffffffffffffffffffffffffffffffffffffffffffffffff"
+    "ffffffff81833603018112610dc357600080fd5b9190910192915050565b60008083357fffffffffffffffffffffffff"
+    "ffffffffffffffffffffffffffffffffffffffe1843603018112610e0257600080fd5b83018035915067ffffffffffff"
+    "ffff821115610e1d57600080fd5b602001915036819003821315610a7e57600080fd5b81838237600091019081529190"
+    "50565b600082357fffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffc1833603018112610d"
+    "c357600080fd5b600082357fffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffa183360301"
+    "8112610dc357600080fdfea2646970667358221220bb2b5c71a328032f97c676ae39a1ec2148d3e5d6f73d95e9b17910"
+    "152d61f16264736f6c634300080c0033"
+)
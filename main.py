@@ -8,6 +8,8 @@ Usage:
     python main.py mint <token> <amount> # Mint a specific token
     python main.py swap <token> <amount> # Swap a specific token
     python main.py stake <token> <amount> # Stake a specific token
+
+    Add --verify-tokens before the command to cross-check token decimals on-chain.
 """
 
 import sys
@@ -15,8 +17,6 @@ import logging
 import argparse
 from decimal import Decimal
 
-from utils import load_env, setup_web3
-from bot import MaitrixBot
 from config import TOKEN_ADDRESSES
 
 # Configure logging
@@ -45,6 +45,8 @@ def main():
     print("=" * 80)
 
     parser = argparse.ArgumentParser(description="MAITRIX Bot - Automate mint → swap → stake operations")
+    parser.add_argument("--verify-tokens", action="store_true",
+                        help="Cross-check the configured token decimals against the chain before running")
     subparsers = parser.add_subparsers(dest="command", help="Command to execute")
 
     # Auto command
@@ -78,6 +80,10 @@ def main():
         return
 
     try:
+        # Import web3-dependent modules only once a command actually needs them
+        from utils import load_env, setup_web3, verify_token_meta
+        from bot import MaitrixBot
+
         # Load environment variables
         load_env()
 
@@ -89,6 +95,9 @@ def main():
         print(f"Network: Arbitrum Sepolia (Chain ID: 421614)")
         print("-" * 80)
 
+        if args.verify_tokens:
+            verify_token_meta(web3)
+
         # Initialize bot
         bot = MaitrixBot(web3, account)
 
@@ -96,47 +105,19 @@ def main():
         if args.command == "auto":
             logger.info("Running full automation cycle...")
             results = bot.run_auto_cycle()
-
-            # Print results
-            for operation, txs in results.items():
-                if txs:
-                    logger.info(f"{operation.capitalize()} operations:")
-                    for tx in txs:
-                        if operation == "swap":
-                            logger.info(f"  Swapped {tx['from_token']} to {tx['to_token']}: "
-                                       f"Amount: {tx['amount']}, TX: {tx['tx_hash']}")
-                        else:
-                            logger.info(f"  {tx['token']}: Amount: {tx['amount']}, TX: {tx['tx_hash']}")
-
-            logger.info("Automation cycle completed.")
+            logger.info(f"Automation cycle completed: {len(results)} transactions.")
 
         elif args.command == "maitrix":
             logger.info("Running MAITRIX sequence based on transaction history...")
             results = bot.run_maitrix_sequence()
-
-            # Print results
-            for operation, txs in results.items():
-                if txs:
-                    logger.info(f"{operation.capitalize()} operations:")
-                    for tx in txs:
-                        if operation == "swap":
-                            logger.info(f"  Swapped {tx['from_token']} to {tx['to_token']}: "
-                                       f"Amount: {tx['amount']}, TX: {tx['tx_hash']}")
-                        elif operation == "approve":
-                            logger.info(f"  Approved {tx['token']} for {tx['spender']}: "
-                                       f"Amount: {tx['amount']}, TX: {tx['tx_hash']}")
-                        else:  # stake
-                            logger.info(f"  Staked {tx['token']} in {tx['pool']}: "
-                                       f"Amount: {tx['amount']}, TX: {tx['tx_hash']}")
-
-            logger.info("MAITRIX sequence completed.")
+            logger.info(f"MAITRIX sequence completed: {len(results)} transactions.")
 
         elif args.command == "balance":
             logger.info("Checking token balances...")
             bot.update_all_balances()
 
-            for symbol, data in bot.token_balances.items():
-                logger.info(f"{symbol}: {data['formatted']}")
+            for symbol in TOKEN_ADDRESSES:
+                logger.info(f"{symbol}: {bot.formatted_balance(symbol)}")
 
         else:  # mint, swap, or stake
             token = args.token
@@ -144,7 +125,7 @@ def main():
 
             if args.amount:
                 # Get token decimals
-                decimals = bot.token_balances[token]["decimals"]
+                decimals = bot.decimals_of(token)
                 amount = parse_amount(args.amount, decimals)
 
             logger.info(f"Running {args.command} operation for {token}...")
@@ -3,26 +3,58 @@ Utility functions for the MAITRIX bot.
 """
 
 import os
+import json
 import time
 import logging
-from typing import Dict, Any, Optional, Tuple
-from decimal import Decimal
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Set, Tuple
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from web3 import Web3
-from web3.exceptions import TransactionNotFound
+from web3.datastructures import AttributeDict
+from web3.middleware import construct_simple_cache_middleware
+from web3.exceptions import BadFunctionCallOutput, ContractLogicError, MethodUnavailable
+from web3._utils.method_formatters import receipt_formatter
+from web3.types import RPCResponse
 from eth_account import Account
+from hexbytes import HexBytes
 from dotenv import load_dotenv
 
 from config import (
     TOKEN_ADDRESSES,
+    TOKEN_DECIMALS,
     TOKEN_ABI,
+    MULTICALL3_ADDRESS,
+    MULTICALL3_ABI,
+    MULTICALL3_BYTECODE,
+    BALANCE_OF_SELECTOR,
+    DECIMALS_SELECTOR,
+    SYMBOL_SELECTOR,
     EXPLORER_URL,
     GAS_PRICE_GWEI,
     GAS_LIMIT,
     TX_CONFIRMATIONS,
     TX_TIMEOUT,
+    TX_POLL_MIN_INTERVAL,
+    TX_POLL_MAX_INTERVAL,
+    BLOCK_TIME_SAMPLE,
     RPC_URL,
+    RPC_TIMEOUT,
+    RPC_POOL_SIZE,
+    RPC_MAX_RETRIES,
 )
 
+try:
+    # Optional: msgspec decodes RPC responses considerably faster than the stdlib json module
+    import msgspec
+    decode_json = msgspec.json.decode
+except ImportError:
+    decode_json = json.loads
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -31,10 +63,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Load the .env file once, when the module is imported
+load_dotenv()
+
+# Account derived from PRIVATE_KEY, created on first use
+_ACCOUNT: Optional[Account] = None
+
 def load_env() -> Dict[str, str]:
     """Load environment variables from .env file."""
-    load_dotenv()
-
     required_vars = ["PRIVATE_KEY"]
     env_vars = {}
 
@@ -49,101 +85,641 @@ def load_env() -> Dict[str, str]:
 
     return env_vars
 
-def setup_web3(rpc_url: str = None) -> Tuple[Web3, Account]:
-    """Set up Web3 connection and account."""
+class FastJSONHTTPProvider(Web3.HTTPProvider):
+    """HTTPProvider with its own keep-alive session and msgspec decoding when installed."""
+
+    def __init__(self, endpoint_uri: str, request_kwargs: Dict[str, Any] = None,
+                 session: requests.Session = None):
+        super().__init__(endpoint_uri, request_kwargs=request_kwargs)
+        self.session = session if session is not None else create_session()
+
+    def post(self, data: bytes) -> bytes:
+        """POST a raw JSON-RPC payload over the shared session."""
+        response = self.session.post(self.endpoint_uri, data=data, **self.get_request_kwargs())
+        response.raise_for_status()
+        return response.content
+
+    def make_request(self, method: str, params: Any) -> RPCResponse:
+        return self.decode_rpc_response(self.post(self.encode_rpc_request(method, params)))
+
+    def decode_rpc_response(self, raw_response: bytes) -> RPCResponse:
+        return decode_json(raw_response)
+
+def create_session() -> requests.Session:
+    """Create a keep-alive HTTP session that retries rate-limited and unsent RPC requests.
+
+    Only failures where the node cannot have seen the request are retried,
+    so a broadcast transaction is never posted twice.
+    """
+    retry = Retry(
+        total=RPC_MAX_RETRIES,
+        read=0,
+        other=0,
+        backoff_factor=0.2,
+        status_forcelist=[429],
+        allowed_methods=frozenset(["POST"]),
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=RPC_POOL_SIZE, max_retries=retry)
+
+    session = requests.Session()
+    session.headers["Connection"] = "keep-alive"
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+def setup_web3(rpc_url: str = None, account: Account = None) -> Tuple[Web3, Account]:
+    """Set up Web3 connection and account.
+
+    Without an explicit account, the one derived from PRIVATE_KEY is created
+    once and reused by later calls.
+    """
+    global _ACCOUNT
+
     if rpc_url is None:
         rpc_url = RPC_URL
 
-    web3 = Web3(Web3.HTTPProvider(rpc_url))
+    web3 = Web3(FastJSONHTTPProvider(
+        rpc_url,
+        session=create_session(),
+        request_kwargs={"timeout": RPC_TIMEOUT}
+    ))
 
     if not web3.is_connected():
         raise ConnectionError(f"Failed to connect to RPC URL: {rpc_url}")
 
-    # Load private key and create account
-    load_dotenv()
-    private_key = os.getenv("PRIVATE_KEY")
-    if not private_key:
-        raise ValueError("Private key not found in environment variables")
+    # web3's validation middleware asks for the chain ID before every call and
+    # transaction; it never changes, so answer it from a cache
+    web3.middleware_onion.add(construct_simple_cache_middleware(rpc_whitelist={"eth_chainId"}),
+                              name="chain_id_cache")
+
+    if account is None:
+        if _ACCOUNT is None:
+            # Load private key and create account
+            private_key = os.getenv("PRIVATE_KEY")
+            if not private_key:
+                raise ValueError("Private key not found in environment variables")
 
-    # Add 0x prefix if not present
-    if not private_key.startswith("0x"):
-        private_key = f"0x{private_key}"
+            # Add 0x prefix if not present
+            if not private_key.startswith("0x"):
+                private_key = f"0x{private_key}"
+
+            _ACCOUNT = Account.from_key(private_key)
+        account = _ACCOUNT
 
-    account = Account.from_key(private_key)
     logger.info(f"Connected to network. Account: {account.address}")
 
+    # Configured tokens take decimals from the static table; any others are fetched up front
+    seed_static_token_meta(web3)
+    load_token_meta(web3, TOKEN_ADDRESSES)
+
     return web3, account
 
+@lru_cache(maxsize=None)
+def get_chain_id(web3: Web3) -> int:
+    """Return the chain ID of a Web3 connection, queried only once."""
+    return web3.eth.chain_id
+
+def get_fee_params(web3: Web3) -> Dict[str, int]:
+    """Return EIP-1559 fee fields derived from the latest base fee.
+
+    Chains without EIP-1559 support get a legacy gasPrice instead.
+    """
+    block, priority_fee = _request_many(web3, [
+        ("eth_getBlockByNumber", ["latest", False]),
+        ("eth_maxPriorityFeePerGas", []),
+    ], allow_errors=True)
+
+    if not block or block.get("baseFeePerGas") is None or priority_fee is None:
+        return {"gasPrice": web3.eth.gas_price}
+
+    base_fee = int(block["baseFeePerGas"], 16)
+    priority_fee = int(priority_fee, 16)
+    return {
+        "maxFeePerGas": 2 * base_fee + priority_fee,
+        "maxPriorityFeePerGas": priority_fee,
+    }
+
+# Token (decimals, symbol) keyed by (chain ID, token address)
+_TOKEN_META: Dict[Tuple[int, str], Tuple[int, str]] = {}
+
+def seed_static_token_meta(web3: Web3) -> None:
+    """Fill the metadata cache from TOKEN_DECIMALS without touching the chain."""
+    chain_id = get_chain_id(web3)
+    for symbol, decimals in TOKEN_DECIMALS.items():
+        _TOKEN_META[(chain_id, TOKEN_ADDRESSES[symbol])] = (decimals, symbol)
+
+def verify_token_meta(web3: Web3) -> List[str]:
+    """Compare TOKEN_DECIMALS with on-chain decimals() in one multicall.
+
+    Mismatches are logged, and the metadata cache is corrected to the
+    on-chain value. Returns the symbols whose decimals differ.
+    """
+    chain_id = get_chain_id(web3)
+    symbols = list(TOKEN_DECIMALS)
+    results = multicall(web3, [(TOKEN_ADDRESSES[symbol], DECIMALS_SELECTOR) for symbol in symbols])
+
+    mismatches = []
+    for symbol, return_data in zip(symbols, results):
+        onchain_decimals = _decode_uint(return_data)
+        if onchain_decimals is None:
+            logger.warning(f"Could not verify decimals for {symbol}: decimals() failed")
+        elif onchain_decimals != TOKEN_DECIMALS[symbol]:
+            logger.error(f"Decimals mismatch for {symbol}: configured {TOKEN_DECIMALS[symbol]}, "
+                         f"on-chain {onchain_decimals}. Using the on-chain value.")
+            _TOKEN_META[(chain_id, TOKEN_ADDRESSES[symbol])] = (onchain_decimals, symbol)
+            mismatches.append(symbol)
+
+    if not mismatches:
+        logger.info(f"Token decimals verified for {len(symbols)} tokens")
+
+    return mismatches
+
+def load_token_meta(web3: Web3, token_addresses: Dict[str, str]) -> None:
+    """Fetch decimals and symbol of the given {symbol: address} tokens in one multicall.
+
+    Tokens whose decimals() reverts default to 18 decimals, and tokens whose
+    symbol() reverts keep their configured symbol.
+    """
+    chain_id = get_chain_id(web3)
+    missing = {
+        symbol: address for symbol, address in token_addresses.items()
+        if (chain_id, address) not in _TOKEN_META
+    }
+    if not missing:
+        return
+
+    calls = []
+    for address in missing.values():
+        calls.append((address, DECIMALS_SELECTOR))
+        calls.append((address, SYMBOL_SELECTOR))
+    results = multicall(web3, calls)
+
+    for i, (symbol, address) in enumerate(missing.items()):
+        _TOKEN_META[(chain_id, address)] = _decode_token_meta(symbol, results[2 * i], results[2 * i + 1])
+
+def _decode_uint(data: Optional[bytes]) -> Optional[int]:
+    """Decode a single uint return value, or None if the call failed or returned nothing."""
+    if not data:
+        return None
+    return int.from_bytes(data[:32], "big")
+
+def _decode_symbol(data: Optional[bytes]) -> Optional[str]:
+    """Decode a symbol() return value, accepting both string and bytes32 ABIs."""
+    if not data:
+        return None
+
+    if len(data) == 32:
+        # Older tokens (MKR style) return bytes32
+        return data.rstrip(b"\0").decode("utf-8", errors="replace")
+
+    offset = int.from_bytes(data[:32], "big")
+    length = int.from_bytes(data[offset:offset + 32], "big")
+    return data[offset + 32:offset + 32 + length].decode("utf-8", errors="replace")
+
+def _decode_token_meta(name: str, decimals_data: Optional[bytes],
+                       symbol_data: Optional[bytes]) -> Tuple[int, str]:
+    """Decode raw decimals() and symbol() results, falling back to 18 and the given name."""
+    decimals = _decode_uint(decimals_data)
+    if decimals is None:
+        logger.warning(f"decimals() reverted for {name}, defaulting to 18")
+        decimals = 18
+
+    symbol = _decode_symbol(symbol_data) or name
+
+    return decimals, symbol
+
+def get_token_meta(web3: Web3, token_contract: Any) -> Tuple[int, str]:
+    """Return the cached (decimals, symbol) of a token, fetching them on first use."""
+    token_address = token_contract.address
+    key = (get_chain_id(web3), token_address)
+    if key not in _TOKEN_META:
+        try:
+            decimals_data = web3.eth.call({"to": token_address, "data": DECIMALS_SELECTOR})
+        except ContractLogicError:
+            decimals_data = None
+        try:
+            symbol_data = web3.eth.call({"to": token_address, "data": SYMBOL_SELECTOR})
+        except ContractLogicError:
+            symbol_data = None
+        _TOKEN_META[key] = _decode_token_meta(token_address, decimals_data, symbol_data)
+
+    return _TOKEN_META[key]
+
+def _read_approvals(path: str) -> Dict[str, Any]:
+    """Read the approvals file, treating a missing or malformed file as empty."""
+    try:
+        with open(path) as f:
+            approvals = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable approvals file {path}: {e}")
+        return {}
+
+    if not isinstance(approvals, dict):
+        logger.warning(f"Ignoring approvals file {path}: not a JSON object")
+        return {}
+
+    return approvals
+
+def load_approvals(path: str, chain_id: int, address: str) -> List[Tuple[str, str]]:
+    """Load the (token, spender) pairs recorded as max-approved for a wallet on a chain."""
+    chain_approvals = _read_approvals(path).get(str(chain_id))
+    if not isinstance(chain_approvals, dict):
+        return []
+
+    return [tuple(pair) for pair in chain_approvals.get(address, [])]
+
+def save_approvals(path: str, chain_id: int, address: str, pairs: List[Tuple[str, str]]) -> None:
+    """Record the max-approved (token, spender) pairs for a wallet on a chain."""
+    approvals = _read_approvals(path)
+
+    chain_approvals = approvals.get(str(chain_id))
+    if not isinstance(chain_approvals, dict):
+        chain_approvals = approvals[str(chain_id)] = {}
+    chain_approvals[address] = sorted(list(pair) for pair in pairs)
+
+    with open(path, "w") as f:
+        json.dump(approvals, f, indent=2)
+
+# Contract factories keyed by (connection, ABI) and instances keyed by (connection, address, ABI).
+# ABIs are the module-level lists from config.py, so their ids are stable.
+_CONTRACT_FACTORIES: Dict[Tuple[int, int], Any] = {}
+_CONTRACTS: Dict[Tuple[int, str, int], Any] = {}
+
+def get_contract(web3: Web3, address: str, abi: list) -> Any:
+    """Get a contract instance, parsing each ABI and building each instance only once per connection.
+
+    The address must already be checksummed, as all addresses in config.py are.
+    """
+    key = (id(web3), address, id(abi))
+    contract = _CONTRACTS.get(key)
+    if contract is None:
+        factory_key = (id(web3), id(abi))
+        factory = _CONTRACT_FACTORIES.get(factory_key)
+        if factory is None:
+            factory = _CONTRACT_FACTORIES[factory_key] = web3.eth.contract(abi=abi)
+        contract = _CONTRACTS[key] = factory(address=address)
+
+    return contract
+
 def get_token_contract(web3: Web3, token_symbol: str, abi: list = None) -> Any:
     """Get token contract instance."""
     if token_symbol not in TOKEN_ADDRESSES:
         raise ValueError(f"Unknown token symbol: {token_symbol}")
 
-    token_address = TOKEN_ADDRESSES[token_symbol]
-    contract_abi = abi if abi else TOKEN_ABI
-
-    return web3.eth.contract(address=Web3.to_checksum_address(token_address), abi=contract_abi)
+    return get_contract(web3, TOKEN_ADDRESSES[token_symbol], abi if abi else TOKEN_ABI)
 
 def get_token_balance(web3: Web3, token_contract: Any, address: str) -> Tuple[int, int, str]:
     """Get token balance, decimals, and symbol."""
-    balance = token_contract.functions.balanceOf(address).call()
-    decimals = token_contract.functions.decimals().call()
-    symbol = token_contract.functions.symbol().call()
+    balance, decimals, symbol = _token_balances(web3, [(token_contract.address, address)])[0]
+    if balance is None:
+        raise ValueError(f"balanceOf reverted for token {token_contract.address}")
 
     return balance, decimals, symbol
 
+def get_token_balances(web3: Web3, queries: List[Tuple[str, str]]) -> List[Tuple[Optional[int], int, str]]:
+    """Get (balance, decimals, symbol) for each (token symbol, wallet) pair in a single multicall.
+
+    The balance is None if that balanceOf call failed.
+    """
+    return _token_balances(web3, [(TOKEN_ADDRESSES[symbol], wallet) for symbol, wallet in queries])
+
+def _token_balances(web3: Web3, queries: List[Tuple[str, str]]) -> List[Tuple[Optional[int], int, str]]:
+    """Read balanceOf, plus any uncached token metadata, for (token address, wallet) pairs in one multicall."""
+    chain_id = get_chain_id(web3)
+    calls = []
+    meta_calls = {}
+    for token_address, wallet in queries:
+        calls.append((token_address, BALANCE_OF_SELECTOR + bytes(12) + bytes.fromhex(wallet[2:])))
+
+        if (chain_id, token_address) not in _TOKEN_META and token_address not in meta_calls:
+            meta_calls[token_address] = [(token_address, DECIMALS_SELECTOR), (token_address, SYMBOL_SELECTOR)]
+
+    # Balance calls come first, followed by a (decimals, symbol) pair per uncached token
+    results = multicall(web3, calls + [call for pair in meta_calls.values() for call in pair])
+    meta_results = results[len(calls):]
+
+    for i, token_address in enumerate(meta_calls):
+        _TOKEN_META[(chain_id, token_address)] = _decode_token_meta(
+            token_address, meta_results[2 * i], meta_results[2 * i + 1]
+        )
+
+    balances = []
+    for (token_address, _), return_data in zip(queries, results):
+        balances.append((_decode_uint(return_data), *_TOKEN_META[(chain_id, token_address)]))
+
+    return balances
+
+def get_token_balances_batch(web3: Web3, token_symbols: List[str],
+                             wallet: str) -> Dict[str, Tuple[Optional[int], int, str]]:
+    """Get {symbol: (balance, decimals, symbol)} for several tokens with one JSON-RPC batch of eth_calls.
+
+    A failed balanceOf yields None for that token.
+    """
+    if not token_symbols:
+        return {}
+
+    calldata = BALANCE_OF_SELECTOR + bytes(12) + bytes.fromhex(wallet[2:])
+    tx_list = [{"to": TOKEN_ADDRESSES[symbol], "data": "0x" + calldata.hex()} for symbol in token_symbols]
+
+    try:
+        results = batch_request(web3, [("eth_call", [tx, "latest"]) for tx in tx_list], allow_errors=True)
+        return_data = [HexBytes(result) if result is not None else None for result in results]
+    except (BatchNotSupported, requests.HTTPError):
+        logger.info("RPC endpoint does not support batch requests, sending balance calls concurrently")
+
+        def call(tx: Dict[str, str]) -> Optional[bytes]:
+            try:
+                return web3.eth.call(tx)
+            except (ContractLogicError, ValueError):
+                return None
+
+        with ThreadPoolExecutor(max_workers=len(tx_list)) as executor:
+            return_data = list(executor.map(call, tx_list))
+
+    return {
+        symbol: (_decode_uint(data), *get_token_meta(web3, get_contract(web3, TOKEN_ADDRESSES[symbol], TOKEN_ABI)))
+        for symbol, data in zip(token_symbols, return_data)
+    }
+
+# Whether Multicall3 is deployed at MULTICALL3_ADDRESS, keyed by RPC URL
+_MULTICALL3_DEPLOYED: Dict[str, bool] = {}
+
+def _multicall3_deployed(web3: Web3) -> bool:
+    """Check once per RPC URL whether the canonical Multicall3 contract has code."""
+    endpoint_uri = web3.provider.endpoint_uri
+    if endpoint_uri not in _MULTICALL3_DEPLOYED:
+        _MULTICALL3_DEPLOYED[endpoint_uri] = len(web3.eth.get_code(MULTICALL3_ADDRESS)) > 0
+        if not _MULTICALL3_DEPLOYED[endpoint_uri]:
+            logger.info("Multicall3 is not deployed on this network, injecting it with a state override")
+
+    return _MULTICALL3_DEPLOYED[endpoint_uri]
+
+def multicall(web3: Web3, calls: List[Tuple[str, bytes]]) -> List[Optional[bytes]]:
+    """Execute (target, calldata) read calls in a single Multicall3 eth_call.
+
+    Returns the raw return data for each call, or None if that call failed.
+    """
+    multicall_contract = get_contract(web3, MULTICALL3_ADDRESS, MULTICALL3_ABI)
+    aggregate = multicall_contract.functions.aggregate3(
+        [(target, True, call_data) for target, call_data in calls]
+    )
+
+    state_override = {MULTICALL3_ADDRESS: {"code": MULTICALL3_BYTECODE}}
+    if _MULTICALL3_DEPLOYED.get(web3.provider.endpoint_uri, True):
+        try:
+            results = aggregate.call()
+        except BadFunctionCallOutput:
+            if _multicall3_deployed(web3):
+                raise
+            results = aggregate.call(state_override=state_override)
+    else:
+        results = aggregate.call(state_override=state_override)
+
+    return [return_data if success else None for success, return_data in results]
+
+class BatchNotSupported(ValueError):
+    """Raised when an RPC endpoint does not accept JSON-RPC batch requests."""
+
+def batch_request(web3: Web3, calls: List[Tuple[str, list]], allow_errors: bool = False) -> List[Any]:
+    """Send several (method, params) JSON-RPC requests in a single HTTP POST.
+
+    Results are returned in the same order as the requests. With
+    allow_errors, a failed request yields None instead of raising.
+    """
+    payload = [
+        {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+        for request_id, (method, params) in enumerate(calls)
+    ]
+    raw_response = web3.provider.post(json.dumps(payload).encode())
+    responses = decode_json(raw_response)
+
+    if not isinstance(responses, list):
+        raise BatchNotSupported(f"RPC endpoint rejected batch request: {responses}")
+
+    results = []
+    for response in sorted(responses, key=lambda r: r["id"]):
+        if "error" in response:
+            if allow_errors:
+                results.append(None)
+                continue
+            raise ValueError(f"Batch request {calls[response['id']][0]} failed: {response['error']}")
+        results.append(response["result"])
+
+    return results
+
+# Endpoints that answered a batch request with a single error
+_NO_BATCH: Set[str] = set()
+
+def _request_many(web3: Web3, calls: List[Tuple[str, list]], allow_errors: bool = False) -> List[Any]:
+    """Send requests as one batch, or one at a time if the endpoint rejects batches."""
+    endpoint = web3.provider.endpoint_uri
+    if endpoint not in _NO_BATCH:
+        try:
+            return batch_request(web3, calls, allow_errors)
+        except BatchNotSupported:
+            logger.info("RPC endpoint does not support batch requests, sending requests one by one")
+            _NO_BATCH.add(endpoint)
+
+    results = []
+    for method, params in calls:
+        response = web3.provider.make_request(method, params)
+        if "error" in response:
+            if allow_errors:
+                results.append(None)
+                continue
+            raise ValueError(f"Request {method} failed: {response['error']}")
+        results.append(response["result"])
+
+    return results
+
+# Scale factors for every decimals value a real token uses
+_POW10 = {decimals: 10 ** decimals for decimals in range(37)}
+
 def format_amount(amount: int, decimals: int) -> str:
     """Format token amount with proper decimal places."""
-    return str(Decimal(amount) / Decimal(10 ** decimals))
+    scale = _POW10[decimals] if decimals in _POW10 else 10 ** decimals
+    whole, fraction = divmod(amount, scale)
+    fraction_digits = str(fraction).zfill(decimals).rstrip("0")
+    return f"{whole}.{fraction_digits}" if fraction_digits else str(whole)
+
+def format_token_amount(web3: Web3, token_symbol: str, amount: int) -> str:
+    """Format a raw amount of a configured token using the cached decimals, without any RPC."""
+    decimals, _ = _TOKEN_META[(get_chain_id(web3), TOKEN_ADDRESSES[token_symbol])]
+    return format_amount(amount, decimals)
 
 def wait_for_transaction(web3: Web3, tx_hash: str, confirmations: int = 1) -> Dict[str, Any]:
     """Wait for transaction to be confirmed."""
+    return wait_for_transactions(web3, [tx_hash], confirmations)[0]
+
+# Endpoints that answered eth_getBlockReceipts with "method not found"
+_NO_BLOCK_RECEIPTS: Set[str] = set()
+
+def _format_receipt(raw_receipt: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a raw JSON-RPC receipt to the form web3's get_transaction_receipt returns."""
+    return AttributeDict.recursive(receipt_formatter(raw_receipt))
+
+@lru_cache(maxsize=None)
+def estimate_block_time(web3: Web3) -> float:
+    """Estimate the average block time in seconds from recent block timestamps."""
+    latest = web3.eth.get_block("latest")
+    earlier = web3.eth.get_block(max(latest["number"] - BLOCK_TIME_SAMPLE, 0))
+
+    blocks = latest["number"] - earlier["number"]
+    if blocks <= 0:
+        return 1.0
+
+    return (latest["timestamp"] - earlier["timestamp"]) / blocks
+
+def wait_for_transactions(web3: Web3, tx_hashes: List[str], confirmations: int = 1) -> List[Dict[str, Any]]:
+    """Wait for several transactions to be confirmed and return their receipts in order."""
+    # Work with hex strings throughout: they are computed once here, go into
+    # the RPC params as-is and compare directly with raw receipt hashes
+    tx_hashes_hex = [HexBytes(tx_hash).hex() for tx_hash in tx_hashes]
+    pending = list(dict.fromkeys(tx_hashes_hex))
+    mined = {}
+    receipts = {}
     start_time = time.time()
+    block_time = estimate_block_time(web3)
 
-    while True:
+    while pending:
         if time.time() - start_time > TX_TIMEOUT:
-            raise TimeoutError(f"Transaction {tx_hash.hex()} timed out after {TX_TIMEOUT} seconds")
+            raise TimeoutError(f"Transactions {', '.join(pending)} timed out after {TX_TIMEOUT} seconds")
 
-        try:
-            receipt = web3.eth.get_transaction_receipt(tx_hash)
+        use_block_receipts = web3.provider.endpoint_uri not in _NO_BLOCK_RECEIPTS
+        unmined = [tx_hash for tx_hash in pending if tx_hash not in mined]
+        probe = unmined[:1] if use_block_receipts else unmined
+
+        results = _request_many(web3, [("eth_blockNumber", [])] + [
+            ("eth_getTransactionReceipt", [tx_hash]) for tx_hash in probe
+        ])
+        current_block = int(results[0], 16)
+
+        poll_each = False
+        for tx_hash, raw_receipt in zip(probe, results[1:]):
+            if raw_receipt is None:
+                continue
+            mined[tx_hash] = _format_receipt(raw_receipt)
+
+            if not use_block_receipts or len(unmined) == 1:
+                continue
+            try:
+                block_receipts = web3.manager.request_blocking(
+                    "eth_getBlockReceipts", [hex(mined[tx_hash]["blockNumber"])]
+                )
+            except MethodUnavailable:
+                logger.info("eth_getBlockReceipts is not supported, polling receipts per transaction")
+                _NO_BLOCK_RECEIPTS.add(web3.provider.endpoint_uri)
+                block_receipts = None
+            except ValueError as e:
+                logger.debug(f"eth_getBlockReceipts failed, polling receipts per transaction: {e}")
+                block_receipts = None
+
+            # A lagging node may not know the block yet and answer null
+            if block_receipts is None:
+                poll_each = True
+                continue
+
+            for raw_block_receipt in block_receipts:
+                block_tx_hash = raw_block_receipt["transactionHash"].lower()
+                if block_tx_hash in unmined and block_tx_hash not in mined:
+                    mined[block_tx_hash] = _format_receipt(raw_block_receipt)
+
+        unresolved = [tx_hash for tx_hash in unmined if tx_hash not in mined]
+        if poll_each and unresolved:
+            raw_receipts = _request_many(web3, [("eth_getTransactionReceipt", [tx_hash]) for tx_hash in unresolved])
+            for tx_hash, raw_receipt in zip(unresolved, raw_receipts):
+                if raw_receipt is not None:
+                    mined[tx_hash] = _format_receipt(raw_receipt)
+
+        still_pending = []
+        for tx_hash in pending:
+            receipt = mined.get(tx_hash)
             if receipt is None:
-                time.sleep(2)
+                still_pending.append(tx_hash)
                 continue
 
             if receipt["status"] == 0:
-                raise ValueError(f"Transaction {tx_hash.hex()} failed")
+                raise ValueError(f"Transaction {tx_hash} failed")
 
-            current_block = web3.eth.block_number
             if current_block - receipt["blockNumber"] >= confirmations:
-                logger.info(f"Transaction confirmed: {EXPLORER_URL}{tx_hash.hex()}")
-                return receipt
-
-            logger.info(f"Waiting for {confirmations} confirmations... "
-                       f"({current_block - receipt['blockNumber']}/{confirmations})")
-            time.sleep(5)
-
-        except TransactionNotFound:
-            logger.info(f"Transaction {tx_hash.hex()} not found yet. Waiting...")
-            time.sleep(5)
+                logger.info("Transaction confirmed: %s%s", EXPLORER_URL, tx_hash)
+                receipts[tx_hash] = receipt
+            else:
+                still_pending.append(tx_hash)
+
+        pending = still_pending
+        if pending:
+            logger.info("Waiting for %d transaction(s) to reach %d confirmations...", len(pending), confirmations)
+
+            if all(tx_hash in mined for tx_hash in pending):
+                # Everything is mined, so sleep until the next confirmation is due
+                missing = min(confirmations - (current_block - mined[tx_hash]["blockNumber"]) for tx_hash in pending)
+                interval = block_time * missing
+            else:
+                interval = block_time * 0.5
+            time.sleep(min(max(interval, TX_POLL_MIN_INTERVAL), TX_POLL_MAX_INTERVAL))
+
+    return [receipts[tx_hash] for tx_hash in tx_hashes_hex]
+
+class NonceManager:
+    """Hand out consecutive nonces for an account from a local counter.
+
+    Call resync() after a failed send to re-read the pending transaction
+    count.
+    """
+
+    def __init__(self, web3: Web3, address: str):
+        self.web3 = web3
+        self.address = address
+        self.lock = threading.Lock()
+        self.next_nonce = web3.eth.get_transaction_count(address, "pending")
+
+    def next(self) -> int:
+        """Return the next nonce and advance the counter."""
+        return self.reserve(1)[0]
+
+    def reserve(self, count: int) -> List[int]:
+        """Reserve count consecutive nonces for a batch of transactions."""
+        with self.lock:
+            first = self.next_nonce
+            self.next_nonce += count
+            return list(range(first, first + count))
+
+    def resync(self) -> None:
+        """Re-read the pending nonce from the node."""
+        with self.lock:
+            self.next_nonce = self.web3.eth.get_transaction_count(self.address, "pending")
 
 def build_tx_params(web3: Web3, from_address: str, to_address: str,
-                   gas_price_gwei: float = None, gas_limit: int = None, data: str = None, value: int = 0) -> Dict[str, Any]:
-    """Build transaction parameters."""
+                   gas_price_gwei: float = None, gas_limit: int = None, data: str = None, value: int = 0,
+                   context: Dict[str, int] = None, nonce_manager: NonceManager = None) -> Dict[str, Any]:
+    """Build transaction parameters.
+
+    A given context is used as-is; otherwise the nonce comes from
+    nonce_manager when one is given.
+    """
     if gas_price_gwei is None:
         gas_price_gwei = GAS_PRICE_GWEI
 
     if gas_limit is None:
         gas_limit = GAS_LIMIT
 
-    gas_price = web3.to_wei(gas_price_gwei, "gwei")
+    if context is None:
+        context = {
+            "gasPrice": web3.to_wei(gas_price_gwei, "gwei"),
+            "nonce": nonce_manager.next() if nonce_manager else web3.eth.get_transaction_count(from_address),
+            "chainId": get_chain_id(web3),
+        }
 
     tx_params = {
         "from": from_address,
         "to": to_address,
-        "gasPrice": gas_price,
         "gas": gas_limit,
-        "nonce": web3.eth.get_transaction_count(from_address),
         "value": value,
+        **context,
     }
 
     if data:
@@ -151,15 +727,127 @@ def build_tx_params(web3: Web3, from_address: str, to_address: str,
 
     return tx_params
 
-def send_transaction(web3: Web3, account: Account, tx_params: Dict[str, Any],
-                    confirmations: int = None) -> Dict[str, Any]:
-    """Sign and send transaction."""
-    if confirmations is None:
-        confirmations = TX_CONFIRMATIONS
-
+def submit_transaction(web3: Web3, account: Account, tx_params: Dict[str, Any]) -> HexBytes:
+    """Sign and send transaction without waiting for it to be mined."""
     signed_tx = account.sign_transaction(tx_params)
     tx_hash = web3.eth.send_raw_transaction(signed_tx.rawTransaction)
 
-    logger.info(f"Transaction sent: {EXPLORER_URL}{tx_hash.hex()}")
+    logger.info("Transaction sent: %s%s", EXPLORER_URL, tx_hash.hex())
+
+    return tx_hash
+
+def confirm_transaction(web3: Web3, tx_hash: HexBytes, confirmations: int = None) -> Dict[str, Any]:
+    """Wait until a submitted transaction has enough confirmations and return its receipt."""
+    if confirmations is None:
+        confirmations = TX_CONFIRMATIONS
 
     return wait_for_transaction(web3, tx_hash, confirmations)
+
+# Background confirmation tracking; threads only start once a transaction is tracked
+_TRACKER = ThreadPoolExecutor(thread_name_prefix="tx-tracker")
+
+def track_transaction(web3: Web3, tx_hash: HexBytes, confirmations: int = None) -> Future:
+    """Confirm a submitted transaction in the background.
+
+    Returns a Future for the receipt, so the caller can keep submitting
+    transactions while earlier ones confirm.
+    """
+    return _TRACKER.submit(confirm_transaction, web3, tx_hash, confirmations)
+
+def send_transaction(web3: Web3, account: Account, tx_params: Dict[str, Any],
+                    confirmations: int = None, nonce_manager: NonceManager = None) -> Dict[str, Any]:
+    """Sign and send transaction, then wait for its confirmations.
+
+    If the send is rejected, the nonce manager (if any) is resynced.
+    """
+    try:
+        tx_hash = submit_transaction(web3, account, tx_params)
+    except Exception:
+        if nonce_manager:
+            nonce_manager.resync()
+        raise
+
+    return confirm_transaction(web3, tx_hash, confirmations)
+
+def send_transactions_parallel(web3: Web3, account: Account, tx_params_list: List[Dict[str, Any]],
+                               confirmations: int = None, nonce_manager: NonceManager = None) -> List[Dict[str, Any]]:
+    """Sign and send several transactions concurrently, then wait for all of them.
+
+    Receipts are returned in the same order as the transactions.
+    """
+    if confirmations is None:
+        confirmations = TX_CONFIRMATIONS
+
+    unassigned = [tx_params for tx_params in tx_params_list if "nonce" not in tx_params]
+    if unassigned:
+        if nonce_manager:
+            nonces = nonce_manager.reserve(len(unassigned))
+        else:
+            base_nonce = web3.eth.get_transaction_count(account.address, "pending")
+            nonces = range(base_nonce, base_nonce + len(unassigned))
+        for tx_params, nonce in zip(unassigned, nonces):
+            tx_params["nonce"] = nonce
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(tx_params_list)) as executor:
+            tx_hashes = list(executor.map(lambda tx_params: submit_transaction(web3, account, tx_params),
+                                          tx_params_list))
+    except Exception:
+        if nonce_manager:
+            nonce_manager.resync()
+        raise
+
+    return wait_for_transactions(web3, tx_hashes, confirmations)
+
+class TxQueue:
+    """Send signed transactions from a background thread in submission order.
+
+    If a send fails, every later transaction is failed too until reset() is called.
+    """
+
+    def __init__(self, web3: Web3):
+        self.web3 = web3
+        self._queue = deque()
+        self._ready = threading.Condition()
+        # The send error that left a nonce gap, if any
+        self._error: Optional[Exception] = None
+        self._worker = threading.Thread(target=self._run, name="tx-queue", daemon=True)
+        self._worker.start()
+
+    def submit(self, raw_tx: bytes) -> Future:
+        """Enqueue a signed transaction and return a Future for its hash."""
+        future = Future()
+        with self._ready:
+            if self._error is not None:
+                future.set_exception(self._error)
+                return future
+            self._queue.append((raw_tx, future))
+            self._ready.notify()
+        return future
+
+    def reset(self) -> None:
+        """Accept transactions again after a failed send, once nonces have been resynced."""
+        with self._ready:
+            self._error = None
+
+    def _run(self) -> None:
+        while True:
+            with self._ready:
+                while not self._queue:
+                    self._ready.wait()
+                raw_tx, future = self._queue.popleft()
+
+            try:
+                tx_hash = self.web3.eth.send_raw_transaction(raw_tx)
+            except Exception as e:
+                future.set_exception(e)
+                with self._ready:
+                    self._error = e
+                    dropped = list(self._queue)
+                    self._queue.clear()
+                for _, queued_future in dropped:
+                    queued_future.set_exception(e)
+                continue
+
+            logger.info("Transaction sent: %s%s", EXPLORER_URL, tx_hash.hex())
+            future.set_result(tx_hash)